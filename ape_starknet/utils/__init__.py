@@ -54,6 +54,8 @@ NETWORKS = {
 }
 _HEX_ADDRESS_REG_EXP = re.compile("(0x)?[0-9a-f]*", re.IGNORECASE | re.ASCII)
 """Same as from eth-utils except not limited length."""
+_CHECKSUM_UPPER_NIBBLE_MASK = bytes.maketrans(b"0123456789abcdef", b"\x00" * 8 + b"\x20" * 8)
+_CHECKSUM_LETTER_MASK = bytes.maketrans(b"0123456789abcdef", b"\x00" * 10 + b"\x20" * 6)
 ALPHA_MAINNET_WL_DEPLOY_TOKEN_KEY = "ALPHA_MAINNET_WL_DEPLOY_TOKEN"
 EXECUTE_METHOD_NAME = "__execute__"
 EXECUTE_SELECTOR = get_selector_from_name(EXECUTE_METHOD_NAME)
@@ -120,19 +122,18 @@ def _to_checksum_address(address: RawAddress) -> AddressType:
 
     address_int = parse_address(address)
     address_str = pad_hex_str(HexBytes(address_int).hex().lower())
-    chars = [c for c in remove_0x_prefix(HexStr(address_str))]
-    hashed = [b for b in HexBytes(keccak_ints([address_int]))]
-
-    for i in range(0, len(chars), 2):
-        try:
-            if hashed[i >> 1] >> 4 >= 8:
-                chars[i] = chars[i].upper()
-            if (hashed[i >> 1] & 0x0F) >= 8:
-                chars[i + 1] = chars[i + 1].upper()
-        except IndexError:
-            continue
-
-    rejoined_address_str = add_0x_prefix(HexStr("".join(chars)))
+    chars = remove_0x_prefix(HexStr(address_str)).encode("ascii")
+    size = len(chars)
+    hashed = remove_0x_prefix(HexStr(HexBytes(keccak_ints([address_int])).hex())).encode("ascii")
+
+    # Flip the case bit (0x20) of every letter whose hash nibble is >= 8,
+    # using byte-translated masks rather than per-character Python logic.
+    upper_mask = hashed.translate(_CHECKSUM_UPPER_NIBBLE_MASK)[:size].ljust(size, b"\x00")
+    letter_mask = chars.translate(_CHECKSUM_LETTER_MASK)
+    flip = int.from_bytes(upper_mask, "big") & int.from_bytes(letter_mask, "big")
+    checksummed = (int.from_bytes(chars, "big") ^ flip).to_bytes(size, "big").decode("ascii")
+
+    rejoined_address_str = add_0x_prefix(HexStr(checksummed))
     return AddressType(HexAddress(HexStr(rejoined_address_str)))
 
 
@@ -329,14 +330,18 @@ def to_int(val: Any) -> int:
     if isinstance(val, int):
         return val
 
-    elif isinstance(val, str) and is_0x_prefixed(val):
-        return eth_to_int(hexstr=val)
-
-    elif isinstance(val, str) and val.isnumeric():
-        return int(val)
+    elif isinstance(val, bytes):
+        # Includes HexBytes.
+        return int.from_bytes(val, "big")
 
     elif isinstance(val, str):
-        return eth_to_int(val.encode())
+        if is_0x_prefixed(val):
+            return int(val, 16)
+
+        elif val.isnumeric():
+            return int(val)
+
+        return int.from_bytes(val.encode(), "big")
 
     elif hasattr(val, "address"):
         return to_int(val.address)
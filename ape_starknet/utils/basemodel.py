@@ -1,5 +1,5 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Optional, Union, cast
+from typing import TYPE_CHECKING, Dict, Optional, Union, cast
 
 from ape.types import AddressType
 from ape.utils import ManagerAccessMixin
@@ -66,31 +66,37 @@ class StarknetBase(ManagerAccessMixin):
         ) or self.starknet_explorer.get_contract_type(address)
 
     def get_local_contract_type(self, class_hash: int) -> Optional[ContractType]:
-        for contract_name, contract_type in self.project_manager.contracts.items():
-            if not contract_type.source_id or not contract_type.source_id.endswith(".cairo"):
+        for contract_type in self.project_manager.contracts.values():
+            source_id = contract_type.source_id
+            if not source_id or source_id[-6:] != ".cairo":
                 continue
 
             program = contract_type.deployment_bytecode
-            if not program:
-                continue
-
-            code = program.bytecode
+            code = program.bytecode if program else None
             if not code:
                 continue
 
-            try:
-                contract_class = create_contract_class(code)
-            except UnicodeDecodeError:
-                continue
+            computed_class_hash = _CLASS_HASH_CACHE.get(code)
+            if computed_class_hash is None:
+                try:
+                    contract_class = create_contract_class(code)
+                except UnicodeDecodeError:
+                    continue
+
+                contract_cls = get_contract_class(contract_class=contract_class)
+                computed_class_hash = compute_class_hash(contract_cls)
+                _CLASS_HASH_CACHE[code] = computed_class_hash
 
-            contract_cls = get_contract_class(contract_class=contract_class)
-            computed_class_hash = compute_class_hash(contract_cls)
             if computed_class_hash == class_hash:
                 return contract_type
 
         return None
 
 
+_CLASS_HASH_CACHE: Dict[str, int] = {}
+"""Class hashes of local Cairo contracts, keyed by their deployment bytecode."""
+
+
 def create_contract_class(code: Union[str, bytes]) -> ContractClass:
     if isinstance(code, str) and is_0x_prefixed(code):
         return ContractClass.deserialize(HexBytes(code))
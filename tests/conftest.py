@@ -1,8 +1,9 @@
 import json
+import os
 import shutil
 from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from tempfile import mkdtemp
 from typing import cast
 
 import ape
@@ -10,19 +11,15 @@ import pytest
 from ape.api.networks import LOCAL_NETWORK_NAME
 from ape.contracts import ContractInstance
 from ethpm_types import ContractType
+from starknet_py.net.client_models import BlockSingleTransactionTrace
 from starkware.cairo.lang.compiler.test_utils import short_string_to_felt
 
 from ape_starknet import tokens as _tokens
 from ape_starknet.accounts import StarknetAccountContainer, StarknetKeyfileAccount
 from ape_starknet.utils import OPEN_ZEPPELIN_ACCOUNT_CLASS_HASH, PLUGIN_NAME
 
-# NOTE: Ensure that we don't use local paths for these
-ape.config.DATA_FOLDER = Path(mkdtemp()).resolve()
-ape.config.PROJECT_FOLDER = Path(mkdtemp()).resolve()
-
 _HERE = Path(__file__).parent
-projects_directory = Path(__file__).parent / "projects"
-project_names = [p.stem for p in projects_directory.iterdir() if p.is_dir()]
+projects_directory = _HERE / "projects"
 ALIAS = "__TEST_ALIAS__"
 SECOND_ALIAS = "__TEST_ALIAS_2__"
 EXISTING_KEY_FILE_ALIAS = f"{ALIAS}existing_key_file"
@@ -37,6 +34,8 @@ START_BALANCE = "1000000 ETH"
 
 # Purposely pick a number larest enough to test Uint256 logic
 TOKEN_INITIAL_SUPPLY = 2 * 2**128
+TOKEN_NAME = short_string_to_felt("TestToken")
+TOKEN_SYMBOL = short_string_to_felt("TEST")
 
 ETH_CONTRACT_TYPE = ContractType.parse_obj(
     {
@@ -94,6 +93,15 @@ ETH_CONTRACT_TYPE = ContractType.parse_obj(
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def ape_folders(tmp_path_factory):
+    # NOTE: Ensure that we don't use local paths for these.
+    #  pytest does not order same-scope autouse fixtures by definition, so `config`,
+    #  `accounts`, the network choices and `clean_projects` request this explicitly.
+    ape.config.DATA_FOLDER = tmp_path_factory.mktemp("data").resolve()
+    ape.config.PROJECT_FOLDER = tmp_path_factory.mktemp("project").resolve()
+
+
 @pytest.fixture(scope="session")
 def existing_key_file_alias():
     return EXISTING_KEY_FILE_ALIAS
@@ -136,16 +144,16 @@ def proxy_project_path():
 
 @pytest.fixture(scope="session")
 def data_folder():
-    return Path(__file__).parent / "data"
+    return _HERE / "data"
 
 
 @pytest.fixture(scope="session")
-def config():
+def config(ape_folders):
     return ape.config
 
 
 @pytest.fixture(scope="session")
-def accounts():
+def accounts(ape_folders):
     return ape.accounts
 
 
@@ -171,13 +179,13 @@ def project(contracts):
 
 
 @pytest.fixture(scope="session")
-def use_local_starknet():
+def use_local_starknet(ape_folders):
     choice = f"{PLUGIN_NAME}:{LOCAL_NETWORK_NAME}:{PLUGIN_NAME}"
     return ape.networks.parse_network_choice(choice)
 
 
 @pytest.fixture(scope="session")
-def use_local_ethereum():
+def use_local_ethereum(ape_folders):
     return ape.networks.parse_network_choice(f"ethereum:{LOCAL_NETWORK_NAME}")
 
 
@@ -209,12 +217,14 @@ def eth_contract_type():
 
 
 @pytest.fixture(autouse=True, scope="session")
-def clean_projects():
+def clean_projects(ape_folders):
     def clean():
-        for project in projects_directory.iterdir():
-            if not project.is_dir() or project.name.startswith("."):
-                continue
+        with os.scandir(projects_directory) as entries:
+            project_dirs = [
+                Path(e.path) for e in entries if e.is_dir() and not e.name.startswith(".")
+            ]
 
+        for project in project_dirs:
             cache_dir = project / ".build"
             if not cache_dir.is_dir():
                 continue
@@ -251,9 +261,10 @@ def contracts(
         """
         A solution to more lazily deploy session-scoped contracts.
         This is helpful to speed up tests when not using them.
+        Each contract is resolved once and then cached on the deployer.
         """
 
-        @property
+        @cached_property
         def my_contract(self) -> ContractInstance:
             with self.use_project() as project:
                 if project.MyContract.deployments:
@@ -265,22 +276,25 @@ def contracts(
                 contract.initialize(sender=account)
                 return contract
 
-        @property
+        @cached_property
         def token(self):
             with self.use_project(name="token") as project:
                 if project.TestToken.deployments:
                     return project.TestToken.deployments[-1]
 
                 account.declare(project.TestToken)
-                name = short_string_to_felt("TestToken")
-                symbol = short_string_to_felt("TEST")
                 contract = project.TestToken.deploy(
-                    name, symbol, 18, token_initial_supply, int(account.address, 16), sender=account
+                    TOKEN_NAME,
+                    TOKEN_SYMBOL,
+                    18,
+                    token_initial_supply,
+                    account.address_int,
+                    sender=account,
                 )
                 _tokens.add_token("test_token", LOCAL_NETWORK_NAME, contract.address)
                 return contract
 
-        @property
+        @cached_property
         def user_token(self):
             with self.use_project(name="token") as project:
                 if project.UseToken.deployments:
@@ -289,7 +303,7 @@ def contracts(
                 account.declare(project.UseToken)
                 return project.UseToken.deploy(sender=account)
 
-        @property
+        @cached_property
         def proxy(self):
             with self.use_project(name="proxy") as project:
                 if project.Proxy.deployments:
@@ -416,30 +430,33 @@ def ephemeral_account_data():
     }
 
 
-@pytest.fixture
-def key_file_account(config, key_file_account_data):
+@pytest.fixture(scope="session")
+def session_key_file_account(config):
     temp_accounts_dir = Path(config.DATA_FOLDER) / "starknet"
     temp_accounts_dir.mkdir(exist_ok=True, parents=True)
     test_key_file_path = temp_accounts_dir / f"{EXISTING_KEY_FILE_ALIAS}.json"
+    return StarknetKeyfileAccount(key_file_path=test_key_file_path)
 
-    if test_key_file_path.is_file():
-        test_key_file_path.unlink()
 
+@pytest.fixture
+def key_file_account(session_key_file_account, key_file_account_data):
+    # NOTE: The key file is re-written for every test, but the account is shared
+    #  so its decrypted key stays cached. Unlocking only runs the key derivation
+    #  again when a previous test locked the account (e.g. `set_autosign(False)`).
+    test_key_file_path = session_key_file_account.key_file_path
+    test_key_file_path.unlink(missing_ok=True)
     test_key_file_path.write_text(json.dumps(key_file_account_data))
+    session_key_file_account.unlock(passphrase=PASSWORD)
 
-    account = StarknetKeyfileAccount(key_file_path=test_key_file_path)
-    account.unlock(passphrase="123")
-
-    yield account
+    yield session_key_file_account
 
-    if test_key_file_path.is_file():
-        test_key_file_path.unlink()
+    test_key_file_path.unlink(missing_ok=True)
 
 
 @pytest.fixture(scope="session")
 def traces_testnet_243810(data_folder):
     content = (data_folder / "traces-testnet-block-243810.json").read_text()
-    return json.loads(content)["traces"]
+    return [BlockSingleTransactionTrace(**trace) for trace in json.loads(content)["traces"]]
 
 
 @pytest.fixture(scope="session")
@@ -1,10 +1,17 @@
+import re
+
 import pytest
 from ape import Contract
 from ape.exceptions import ContractLogicError, OutOfGasError
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from ape_starknet.exceptions import StarknetProviderError
 from ape_starknet.utils import EXECUTE_METHOD_NAME
 
+ALREADY_INITIALIZED_PATTERN = re.compile("Already initialized")
+ASSERT_EQ_FAILED_PATTERN = re.compile("An ASSERT_EQ instruction failed.*")
+
 
 def test_declare_then_deploy(account, chain, project, provider):
     """
@@ -112,9 +119,8 @@ def test_unsigned_contract_transaction(contract, account, initial_balance):
 def test_decode_logs(contract, account, starknet):
     increase_amount = 9933
     receipt = contract.increase_balance(account.address, increase_amount, sender=account)
-    logs = list(receipt.decode_logs(contract.balance_increased))
-    assert len(logs) == 1
-    assert logs[0].amount == increase_amount
+    [log] = receipt.decode_logs(contract.balance_increased)
+    assert log.amount == increase_amount
 
     from_address = receipt.logs[0]["from_address"]
     log_sender_address = starknet.decode_address(from_address)
@@ -122,16 +128,14 @@ def test_decode_logs(contract, account, starknet):
 
 
 def test_revert_message(contract, account):
-    reason = "Already initialized"
-    with pytest.raises(ContractLogicError, match=reason):
+    with pytest.raises(ContractLogicError, match=ALREADY_INITIALIZED_PATTERN):
         # Already initialized from fixture
         contract.initialize(sender=account)
 
 
 def test_revert_no_message(contract, account):
     contract.reset(sender=account)
-    reason = "An ASSERT_EQ instruction failed.*"
-    with pytest.raises(ContractLogicError, match=reason):
+    with pytest.raises(ContractLogicError, match=ASSERT_EQ_FAILED_PATTERN):
         contract.increase_balance(account.address, 123, sender=account)
 
     # Re-initialize (re-store state)
@@ -151,6 +155,15 @@ def test_array_inputs(contract, account):
     assert contract.get_last_sum() == 6
 
 
+@pytest.mark.fuzzing
+@settings(max_examples=50, deadline=None)
+@given(values=st.lists(st.integers(min_value=0, max_value=2**64), min_size=1, max_size=16))
+def test_array_inputs_fuzz(contract, account, values):
+    # Re-uses the session-scoped deployment, so each example only costs one invoke.
+    contract.store_sum(len(values), values, sender=account)
+    assert contract.get_last_sum() == sum(values)
+
+
 def test_complex_struct_argument(contract, account):
     complex_struct = {
         "timestamp": 42,
@@ -173,100 +186,104 @@ def test_complex_struct_argument(contract, account):
 #
 
 
-@pytest.mark.parametrize(
-    "method, returndata_expected, return_value_expected",
-    [
-        ("array", ["0x3", "0x1", "0x2", "0x3"], [1, 2, 3]),
-        (
-            "array_complex_struct",
-            [
-                "0x3",
-                "0x0",
-                "0x7b",
-                "0x0",
-                "0x0",
-                "0x7b",
-                "0x1",
-                "0x0",
-                "0x7b",
-                "0x7b",
-                "0x0",
-                "0x2",
-                "0x0",
-                "0x0",
-                "0x0",
-                "0x0",
-            ],
-            [
-                {
-                    "timestamp": 0,
-                    "value0": 123,
-                    "value1": 41854731131275431005995076714107490009088,
-                },
-                {
-                    "timestamp": 1,
-                    "value0": 41854731131275431005995076714107490009088,
-                    "value1": 123,
-                },
-                {"timestamp": 2, "value0": 0, "value1": 0},
-            ],
-        ),
-        (
-            "array_uint256",
-            ["0x3", "0x7b", "0x0", "0x0", "0x7b", "0x0", "0x0"],
-            [
-                123,
-                41854731131275431005995076714107490009088,
-                0,
-            ],
-        ),
-        (
-            "complex_struct",
-            ["0x4d2", "0x7b", "0x0", "0x0", "0x7b"],
+METHOD_OUTPUT_CASES = (
+    ("array", ["0x3", "0x1", "0x2", "0x3"], [1, 2, 3]),
+    (
+        "array_complex_struct",
+        [
+            "0x3",
+            "0x0",
+            "0x7b",
+            "0x0",
+            "0x0",
+            "0x7b",
+            "0x1",
+            "0x0",
+            "0x7b",
+            "0x7b",
+            "0x0",
+            "0x2",
+            "0x0",
+            "0x0",
+            "0x0",
+            "0x0",
+        ],
+        [
             {
-                "timestamp": 1234,
+                "timestamp": 0,
                 "value0": 123,
                 "value1": 41854731131275431005995076714107490009088,
             },
-        ),
-        ("felt", ["0x2"], 2),
+            {
+                "timestamp": 1,
+                "value0": 41854731131275431005995076714107490009088,
+                "value1": 123,
+            },
+            {"timestamp": 2, "value0": 0, "value1": 0},
+        ],
+    ),
+    (
+        "array_uint256",
+        ["0x3", "0x7b", "0x0", "0x0", "0x7b", "0x0", "0x0"],
+        [
+            123,
+            41854731131275431005995076714107490009088,
+            0,
+        ],
+    ),
+    (
+        "complex_struct",
+        ["0x4d2", "0x7b", "0x0", "0x0", "0x7b"],
+        {
+            "timestamp": 1234,
+            "value0": 123,
+            "value1": 41854731131275431005995076714107490009088,
+        },
+    ),
+    ("felt", ["0x2"], 2),
+    (
+        "mix",
+        [
+            "0x1",
+            "0x2",
+            "0x3",
+            "0x4",
+            "0x7b",
+            "0x0",
+            "0x3",
+            "0x8",
+            "0x9",
+            "0xa",
+            "0xb",
+            "0x0",
+            "0x7b",
+        ],
         (
-            "mix",
-            [
-                "0x1",
-                "0x2",
-                "0x3",
-                "0x4",
-                "0x7b",
-                "0x0",
-                "0x3",
-                "0x8",
-                "0x9",
-                "0xa",
-                "0xb",
-                "0x0",
-                "0x7b",
-            ],
-            (
-                1,
-                [3, 4],
-                123,
-                [8, 9, 10],
-                11,
-                41854731131275431005995076714107490009088,
-            ),
+            1,
+            [3, 4],
+            123,
+            [8, 9, 10],
+            11,
+            41854731131275431005995076714107490009088,
         ),
-        ("uint256", ["0x1", "0x0"], 1),
+    ),
+    ("uint256", ["0x1", "0x0"], 1),
+    (
+        "uint256s",
+        ["0x7b", "0x0", "0x0", "0x7b", "0x0", "0x0"],
         (
-            "uint256s",
-            ["0x7b", "0x0", "0x0", "0x7b", "0x0", "0x0"],
-            (
-                123,
-                41854731131275431005995076714107490009088,
-                0,
-            ),
+            123,
+            41854731131275431005995076714107490009088,
+            0,
         ),
-    ],
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "method, returndata_expected, return_value_expected",
+    METHOD_OUTPUT_CASES,
+    ids=[case[0] for case in METHOD_OUTPUT_CASES],
 )
 def test_external_and_view_method_outputs(
     method, returndata_expected, return_value_expected, contract, account
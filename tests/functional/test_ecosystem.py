@@ -7,6 +7,8 @@ from ethpm_types.abi import MethodABI
 from hexbytes import HexBytes
 from starkware.starknet.public.abi import get_selector_from_name
 
+from ape_starknet.utils import get_class_hash
+
 INT_ADDRESS = 269168490721327376227480949634158339134330130662514218728945045982440529971
 STR_ADDRESS = "0x0098580E36aB1485C66F0Dc95c2c923E734B7aF44d04Dd2B5B9d0809Aa672033"
 HEXBYTES_ADDRESS = HexBytes(STR_ADDRESS)
@@ -52,3 +54,19 @@ def test_decode_logs(starknet, event_abi, raw_logs):
     actual = list(starknet.decode_logs(raw_logs, event_abi))
     assert len(actual) == 1
     assert actual[0].amount == "4321"
+
+
+def test_get_local_contract_type(monkeypatch, starknet, project):
+    my_contract = project.MyContract.contract_type
+    factory = project.ContractFactory.contract_type
+    my_contract_class_hash = get_class_hash(my_contract.deployment_bytecode.bytecode)
+    factory_class_hash = get_class_hash(factory.deployment_bytecode.bytecode)
+    assert starknet.get_local_contract_type(my_contract_class_hash) == my_contract
+
+    # Simulate re-compiling MyContract to different bytecode.
+    recompiled = my_contract.copy(update={"deployment_bytecode": factory.deployment_bytecode})
+    monkeypatch.setattr(
+        type(starknet.project_manager), "contracts", property(lambda _: {"MyContract": recompiled})
+    )
+    assert starknet.get_local_contract_type(my_contract_class_hash) is None
+    assert starknet.get_local_contract_type(factory_class_hash) == recompiled
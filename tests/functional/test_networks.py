@@ -30,13 +30,6 @@ def eth_contract(in_ethereum, eth_contract_container):
     return eth_contract_container.deployments[-1]
 
 
-@pytest.fixture(scope="module")
-def stark_contract(use_local_starknet, config, project_path):
-    with use_local_starknet:
-        with config.using_project(project_path) as project:
-            yield project.MyContract.deployments[-1]
-
-
 def test_use_eth_network_from_fixture(eth_contract, eth_account, in_ethereum):
     # Shows that we can write Ethereum-only tests within a multi-chain test module
     # (NOTE: 'starknet' is the default ecosystem for this project)
@@ -44,9 +37,9 @@ def test_use_eth_network_from_fixture(eth_contract, eth_account, in_ethereum):
     assert eth_contract.myNumber() == 123
 
 
-def test_use_starknet_network_from_fixture(account, stark_contract, in_starknet):
+def test_use_starknet_network_from_fixture(account, contract, in_starknet):
     # Shows that we can write Starknet-only tests within a multi-chain test module
-    receipt = stark_contract.increase_balance(account.address, 123, sender=account)
+    receipt = contract.increase_balance(account.address, 123, sender=account)
     assert not receipt.failed
 
 
@@ -54,12 +47,12 @@ def test_switch_to_ethereum_mid_test(
     provider,
     eth_account,
     eth_contract_container,
-    stark_contract,
+    contract,
     account,
     in_starknet,
     use_local_ethereum,
 ):
-    receipt = stark_contract.increase_balance(account.address, 123, sender=account)
+    receipt = contract.increase_balance(account.address, 123, sender=account)
     assert not receipt.failed
 
     # Shows that we can change to Ethereum within an individual test
@@ -77,5 +70,5 @@ def test_switch_to_ethereum_mid_test(
         assert eth_contract.myNumber() == 123
 
     # Switch back to Starknet
-    receipt = stark_contract.increase_balance(account.address, 123, sender=account)
+    receipt = contract.increase_balance(account.address, 123, sender=account)
     assert not receipt.failed
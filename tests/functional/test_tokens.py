@@ -24,12 +24,20 @@ def test_get_balance(tokens, account, token_initial_supply, token):
         assert tokens.get_balance(account, token=token) == token_initial_supply
 
 
-@all_tokens
-def test_transfer(tokens, account, second_account, token):
+@pytest.mark.parametrize(
+    "token, amount",
+    (
+        ("eth", 10),
+        ("test_token", 10),
+        # Value large enough to properly test Uint256 logic
+        ("test_token", 2**128 + 1),
+    ),
+)
+def test_transfer(tokens, account, second_account, token, amount):
     initial_balance = tokens.get_balance(second_account.address, token=token)
-    tokens.transfer(account.address, second_account.address, 10, token=token)
+    tokens.transfer(account.address, second_account.address, amount, token=token)
     actual = tokens.get_balance(second_account.address, token=token)
-    expected = initial_balance + 10
+    expected = initial_balance + amount
     assert actual == expected
 
 
@@ -41,19 +49,6 @@ def test_transfer_providing_a_struct(tokens, account, second_account, token):
     assert tokens.get_balance(second_account, token=token) == initial_balance + 10
 
 
-def test_large_transfer(tokens, account, second_account):
-    initial_balance = tokens.get_balance(second_account.address, token="test_token")
-
-    # Value large enough to properly test Uint256 logic
-    balance_to_transfer = 2**128 + 1
-    tokens.transfer(
-        account.address, second_account.address, balance_to_transfer, token="test_token"
-    )
-    actual = tokens.get_balance(second_account.address, token="test_token")
-    expected = initial_balance + balance_to_transfer
-    assert actual == expected
-
-
 @all_tokens
 def test_is_token(tokens, token):
     # Ensure it's recognized as a token
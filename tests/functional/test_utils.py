@@ -8,7 +8,6 @@ from ape.exceptions import (
 )
 from hexbytes import HexBytes
 from starknet_py.net.client_errors import ClientError, ContractNotFoundError
-from starknet_py.net.client_models import BlockSingleTransactionTrace
 from starknet_py.transaction_exceptions import TransactionRejectedError
 
 from ape_starknet.exceptions import StarknetProviderError
@@ -24,13 +23,14 @@ from ape_starknet.utils import (
 TEST_ADDRESS = 852629284295565304522725188288313475155928521990240236795402253191102056828
 
 
-@pytest.mark.parametrize("iteration", range(10))
-def test_get_random_private_key(iteration):
-    pkey = get_random_private_key()
-    assert len(pkey) == 66
-    pkey_int = int(pkey, 16)
-    pkey_back_to_str = HexBytes(pkey_int).hex()
-    assert pkey_back_to_str.replace("0x", "") in pkey
+def test_get_random_private_key():
+    # Sample a few keys since they are random.
+    for _ in range(10):
+        pkey = get_random_private_key()
+        assert len(pkey) == 66
+        pkey_int = int(pkey, 16)
+        pkey_back_to_str = HexBytes(pkey_int).hex()
+        assert pkey_back_to_str.replace("0x", "") in pkey
 
 
 def test_is_checksum_address(account):
@@ -44,105 +44,109 @@ def test_to_checksum_address(account):
     assert actual == expected
 
 
-@pytest.mark.parametrize(
-    "exception, expected",
-    [
-        (ApeException("Foo!"), ApeException("Foo!")),
-        (
-            ClientError(
-                message=(
-                    '{"message":"Error at pc=0:91:\nGot an exception '
-                    "while executing a hint.\nCairo traceback (most r"
-                    "ecent call last):\nUnknown location (pc=0:739)\n"
-                    "Unknown location (pc=0:682)\nUnknown location (p"
-                    "c=0:358)\nUnknown location (pc=0:400)\nUnknown l"
-                    "ocation (pc=0:423)\n\nError in the called contra"
-                    "ct (0x123):\nError at pc=0:41:\nGot an exception"
-                    " while executing a hint.\nCairo traceback (most "
-                    "recent call last):\nUnknown location (pc=0:7453)"
-                    "\nUnknown location (pc=0:7437)\nUnknown location"
-                    " (pc=0:4491)\nError message: Strings: exceeding "
-                    "max felt string length (31)\nUnknown location (p"
-                    "c=0:3219)\nUnknown location (pc=0:47)\n\nTraceba"
-                    'ck (most recent call last):\n  File "<hint6>", l'
-                    "ine 3, in <module>\nAssertionError: a = 36185027"
-                    "886661312136973227830950701056231072153315966999"
-                    '20561358720 is out of range.","status_code":500}'
-                ),
+CLIENT_ERROR_CASES = (
+    pytest.param(ApeException("Foo!"), ApeException("Foo!"), id="ape-exception"),
+    pytest.param(
+        ClientError(
+            message=(
+                '{"message":"Error at pc=0:91:\nGot an exception '
+                "while executing a hint.\nCairo traceback (most r"
+                "ecent call last):\nUnknown location (pc=0:739)\n"
+                "Unknown location (pc=0:682)\nUnknown location (p"
+                "c=0:358)\nUnknown location (pc=0:400)\nUnknown l"
+                "ocation (pc=0:423)\n\nError in the called contra"
+                "ct (0x123):\nError at pc=0:41:\nGot an exception"
+                " while executing a hint.\nCairo traceback (most "
+                "recent call last):\nUnknown location (pc=0:7453)"
+                "\nUnknown location (pc=0:7437)\nUnknown location"
+                " (pc=0:4491)\nError message: Strings: exceeding "
+                "max felt string length (31)\nUnknown location (p"
+                "c=0:3219)\nUnknown location (pc=0:47)\n\nTraceba"
+                'ck (most recent call last):\n  File "<hint6>", l'
+                "ine 3, in <module>\nAssertionError: a = 36185027"
+                "886661312136973227830950701056231072153315966999"
+                '20561358720 is out of range.","status_code":500}'
             ),
-            ContractLogicError(revert_message="Strings: exceeding max felt string length (31)"),
         ),
-        (
-            ClientError(
-                message=(
-                    '{"message":"An InvokeFunction transaction '
-                    '(version != 0) must have a nonce.","status_code":500}\n'
-                )
-            ),
-            StarknetProviderError(
-                "An InvokeFunction transaction (version != 0) must have a nonce."
-            ),
+        ContractLogicError(revert_message="Strings: exceeding max felt string length (31)"),
+        id="felt-string-too-long",
+    ),
+    pytest.param(
+        ClientError(
+            message=(
+                '{"message":"An InvokeFunction transaction '
+                '(version != 0) must have a nonce.","status_code":500}\n'
+            )
         ),
-        (
-            ContractNotFoundError(
-                address=TEST_ADDRESS,
-                block_hash="pending",
-            ),
-            StarknetProviderError(
-                f"No contract with address {TEST_ADDRESS} found for block with block_hash: pending."
-            ),
+        StarknetProviderError("An InvokeFunction transaction (version != 0) must have a nonce."),
+        id="missing-nonce",
+    ),
+    pytest.param(
+        ContractNotFoundError(
+            address=TEST_ADDRESS,
+            block_hash="pending",
         ),
-        (
-            TransactionRejectedError(message="Actual fee exceeded max fee.\n999800000000000 > 1"),
-            OutOfGasError(),
+        StarknetProviderError(
+            f"No contract with address {TEST_ADDRESS} found for block with block_hash: pending."
         ),
-        (
-            TransactionRejectedError(
-                message="Error at pc=0:330: An ASSERT_EQ instruction failed: 0 != 1."
-            ),
-            ContractLogicError(
-                revert_message="Error at pc=0:330: An ASSERT_EQ instruction failed: 0 != 1."
-            ),
+        id="contract-not-found",
+    ),
+    pytest.param(
+        TransactionRejectedError(message="Actual fee exceeded max fee.\n999800000000000 > 1"),
+        OutOfGasError(),
+        id="max-fee-exceeded",
+    ),
+    pytest.param(
+        TransactionRejectedError(
+            message="Error at pc=0:330: An ASSERT_EQ instruction failed: 0 != 1."
         ),
-        (ValueError("Foo!"), ValueError("Foo!")),
-        (
-            ClientError(
-                "Client failed with code 500: "
-                '{"code": "StarknetErrorCode.TRANSACTION_FAILED", '
-                '"message": "Error at pc=0:166:\\nSignature '
-                "(3043690392760996823501689233597619912806801642077770433986032017604167509951, "
-                "140932343948720055880187056217327835615175238698469767628052057966817353503), "
-                "is invalid, with respect to the public key "
-                "6835981319243216192375995835136133760276036836, "
-                "and the message hash "
-                "2506859578009568926921040670359334110481328447009243612404313172189339494201."
-                "\\nCairo traceback (most recent call last):\\nUnknown "
-                "location (pc=0:413)\\nUnknown location (pc=0:400)"
-                '\\nUnknown location (pc=0:320)"}.'
-            ),
-            SignatureError(
-                "Invalid signature with respect to public key "
-                "0x13289378ec83a20385758c7ec489853213cfce4."
-            ),
+        ContractLogicError(
+            revert_message="Error at pc=0:330: An ASSERT_EQ instruction failed: 0 != 1."
         ),
-        (
-            ClientError(
-                "Client failed with code 500: "
-                '{{"code":"StarknetErrorCode.UNINITIALIZED_CONTRACT",'
-                f'"message":"Requested contract address {TEST_ADDRESS} is not deployed."}}\n.'
-            ),
-            ContractError(f"Contract at address '{TEST_ADDRESS}' not deployed."),
+        id="assert-eq-failed",
+    ),
+    pytest.param(ValueError("Foo!"), ValueError("Foo!"), id="value-error"),
+    pytest.param(
+        ClientError(
+            "Client failed with code 500: "
+            '{"code": "StarknetErrorCode.TRANSACTION_FAILED", '
+            '"message": "Error at pc=0:166:\\nSignature '
+            "(3043690392760996823501689233597619912806801642077770433986032017604167509951, "
+            "140932343948720055880187056217327835615175238698469767628052057966817353503), "
+            "is invalid, with respect to the public key "
+            "6835981319243216192375995835136133760276036836, "
+            "and the message hash "
+            "2506859578009568926921040670359334110481328447009243612404313172189339494201."
+            "\\nCairo traceback (most recent call last):\\nUnknown "
+            "location (pc=0:413)\\nUnknown location (pc=0:400)"
+            '\\nUnknown location (pc=0:320)"}.'
+        ),
+        SignatureError(
+            "Invalid signature with respect to public key "
+            "0x13289378ec83a20385758c7ec489853213cfce4."
         ),
-    ],
+        id="invalid-signature",
+    ),
+    pytest.param(
+        ClientError(
+            "Client failed with code 500: "
+            '{{"code":"StarknetErrorCode.UNINITIALIZED_CONTRACT",'
+            f'"message":"Requested contract address {TEST_ADDRESS} is not deployed."}}\n.'
+        ),
+        ContractError(f"Contract at address '{TEST_ADDRESS}' not deployed."),
+        id="uninitialized-contract",
+    ),
 )
+
+
+@pytest.mark.parametrize("exception, expected", CLIENT_ERROR_CASES)
 def test_handle_client_error(exception, expected):
     error = handle_client_error(exception)
     assert str(error) == str(expected)
 
 
 def test_extract_trace_data(traces_testnet_243810, traces_testnet_243810_results):
-    for trace in traces_testnet_243810:
-        trace_object = BlockSingleTransactionTrace(**trace)
+    for trace_object in traces_testnet_243810:
         trace_data = extract_trace_data(trace_object)
         assert isinstance(trace_data, dict)
 
@@ -1,5 +1,6 @@
 import random
 import re
+from functools import cached_property
 from typing import List, Tuple, Union
 
 import pytest
@@ -56,7 +57,7 @@ class ListOutputWrapper:
     def __init__(self, output: str):
         self.output = output
 
-    @property
+    @cached_property
     def lines(self) -> List[str]:
         return self.output.splitlines()
 
@@ -68,7 +69,7 @@ class ListOutputWrapper:
 
     def get_section(self, alias: str) -> ListOutputSection:
         section: List[str] = []
-        for index, line in enumerate(self.lines):
+        for line in self.lines:
             if alias not in line and not section:
                 # Haven't found start of the section yet.
                 continue